@@ -9,6 +9,7 @@ from random import Random
 from typing import List, Tuple
 import time
 
+from geometry.compact import CompactTunnels
 from geometry.primitives import Rectangle, line_intersects
 
 
@@ -36,8 +37,11 @@ class GeneticAlgorithm:
         self.tunnels = tunnels
         self.P = params
         self.rnd = Random(self.P.seed)
+        self._compact = tunnels if isinstance(tunnels, CompactTunnels) else None
 
     def _fitness(self, a: float, k: float) -> int:
+        if self._compact is not None:
+            return self._compact.count_hits(a, k)
         return sum(line_intersects(r, a, k) for r in self.tunnels)
 
     def _random_line(self) -> Tuple[float, float]:
@@ -0,0 +1,87 @@
+"""
+ Жадібне покриття тунелів кількома прямими.
+ Кандидати — ті самі прямі через пари вершин, що й у PartialEnum.
+ Лічильники влучань будуються один раз і зменшуються,
+ коли тунель покрито, тож наступні раунди не перераховують перетини.
+"""
+from __future__ import annotations
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from algorithms.partial_enum import candidate_lines
+from geometry.compact import CompactTunnels
+from geometry.primitives import Rectangle, line_intersects
+
+
+@dataclass(slots=True)
+class CoverLine:
+    a: float
+    k: float
+    Z: int
+    Z_total: int
+
+
+class GreedyCover:
+    def __init__(self, timeout_s: float = 5.0, max_pairs: Optional[int] = None):
+        self.timeout_s = timeout_s
+        self.max_pairs = max_pairs
+        self.pairs_checked = 0
+        self.runtime_ms = 0.0
+
+    def _candidates(
+        self, tunnels: List[Rectangle], t_start: float
+    ) -> Tuple[List[Tuple[float, float]], List[List[int]]]:
+        """Прямі-кандидати та індекси тунелів, які перетинає кожна з них."""
+        lines: List[Tuple[float, float]] = []
+        hits: List[List[int]] = []
+        compact = tunnels if isinstance(tunnels, CompactTunnels) else None
+        for a, k in candidate_lines(self, tunnels, t_start):
+            lines.append((a, k))
+            if compact is not None:
+                hits.append(compact.hit_indices(a, k))
+            else:
+                hits.append([i for i, r in enumerate(tunnels)
+                             if line_intersects(r, a, k)])
+        return lines, hits
+
+    def solve(self, tunnels: List[Rectangle], L: int) -> List[CoverLine]:
+        """
+        До L прямих; Z — нові тунелі цієї прямої, Z_total — накопичено.
+        Зупиняється раніше, якщо жодна пряма не додає покриття.
+        """
+        t_start = time.perf_counter()
+        if len(tunnels) < 2:
+            return []
+        lines, hits = self._candidates(tunnels, t_start)
+        counts = [len(h) for h in hits]
+        stabbed_by: List[List[int]] = [[] for _ in range(len(tunnels))]
+        for c, h in enumerate(hits):
+            for i in h:
+                stabbed_by[i].append(c)
+
+        covered = [False] * len(tunnels)
+        result: List[CoverLine] = []
+        total = 0
+        for _ in range(L):
+            if not counts:
+                break
+            c = max(range(len(counts)), key=counts.__getitem__)
+            Z = counts[c]
+            if Z <= 0:
+                break
+            total += Z
+            for i in hits[c]:
+                if covered[i]:
+                    continue
+                covered[i] = True
+                for c2 in stabbed_by[i]:
+                    counts[c2] -= 1
+            result.append(CoverLine(*lines[c], Z=Z, Z_total=total))
+        self.runtime_ms = (time.perf_counter() - t_start) * 1e3
+        return result
+
+
+def solve(tunnels, L: int, timeout_s: float = 5.0,
+          max_pairs: Optional[int] = None) -> List[CoverLine]:
+    return GreedyCover(timeout_s, max_pairs).solve(tunnels, L)
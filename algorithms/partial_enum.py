@@ -1,10 +1,39 @@
 from __future__ import annotations
 import time
 from itertools import combinations
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
+from geometry.compact import CompactTunnels
 from geometry.primitives import Rectangle, line_intersects
 
 
+def corner_pairs(tunnels) -> Iterator[Tuple[float, float, float, float]]:
+    """Усі пари (x1, y1, x2, y2) вершин двох різних тунелів."""
+    if isinstance(tunnels, CompactTunnels):
+        yield from tunnels.corner_pairs()
+        return
+    for r1, r2 in combinations(tunnels, 2):
+        for v1 in r1.corners:
+            for v2 in r2.corners:
+                yield v1.x, v1.y, v2.x, v2.y
+
+
+def candidate_lines(solver, tunnels, t_start: float) -> Iterator[Tuple[float, float]]:
+    """
+    Прямі (a, k) через пари вершин. Рахує solver.pairs_checked і
+    зупиняється після solver.max_pairs пар або solver.timeout_s секунд.
+    """
+    for x1, y1, x2, y2 in corner_pairs(tunnels):
+        solver.pairs_checked += 1
+        if solver.max_pairs and solver.pairs_checked > solver.max_pairs:
+            return
+        if time.perf_counter() - t_start > solver.timeout_s:
+            return
+        if x1 == x2:
+            continue
+        a = (y2 - y1) / (x2 - x1)
+        yield a, y1 - a * x1
+
+
 class PartialEnum:
     def __init__(self, timeout_s: float = 5.0, max_pairs: Optional[int] = None):
         self.timeout_s = timeout_s
@@ -17,24 +46,15 @@ class PartialEnum:
             return 0.0, 0.0, 0
         best_a = best_k = 0.0
         best_Z = -1
+        compact = tunnels if isinstance(tunnels, CompactTunnels) else None
         t_start = time.perf_counter()
-        for r1, r2 in combinations(tunnels, 2):
-            for v1 in r1.corners:
-                for v2 in r2.corners:
-                    self.pairs_checked += 1
-                    if self.max_pairs and self.pairs_checked > self.max_pairs:
-                        self.runtime_ms = (time.perf_counter() - t_start) * 1e3
-                        return best_a, best_k, best_Z
-                    if time.perf_counter() - t_start > self.timeout_s:
-                        self.runtime_ms = (time.perf_counter() - t_start) * 1e3
-                        return best_a, best_k, best_Z
-                    if v1.x == v2.x:
-                        continue
-                    a = (v2.y - v1.y) / (v2.x - v1.x)
-                    k = v1.y - a * v1.x
-                    Z = sum(line_intersects(r, a, k) for r in tunnels)
-                    if Z > best_Z:
-                        best_a, best_k, best_Z = a, k, Z
+        for a, k in candidate_lines(self, tunnels, t_start):
+            if compact is not None:
+                Z = compact.count_hits(a, k)
+            else:
+                Z = sum(line_intersects(r, a, k) for r in tunnels)
+            if Z > best_Z:
+                best_a, best_k, best_Z = a, k, Z
         self.runtime_ms = (time.perf_counter() - t_start) * 1e3
         return best_a, best_k, best_Z
 
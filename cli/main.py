@@ -11,9 +11,11 @@ import click
 import colorama
 from algorithms.partial_enum import PartialEnum
 from algorithms.genetic import GAParams, GeneticAlgorithm
-from data_io.io import load_instance, save_instance
+from algorithms.greedy_cover import GreedyCover
+from data_io.io import load_compact, load_instance, save_instance
 from data_io.generator import random_instance
-from experiments.runner import run_dim_experiment, make_k_list
+from experiments.runner import run_dim_experiment, resume_experiment, make_k_list
+from geometry.compact import CompactTunnels
 from geometry.primitives import Point, Rectangle
 
 colorama.init(autoreset=True)
@@ -91,8 +93,27 @@ def cli():
 
 @cli.command()
 @click.option("--file", type=click.Path(exists=True, dir_okay=False), required=True)
-def solve(file):
-    tuns = load_instance(file)
+@click.option("--lines", "n_lines", default=1, show_default=True,
+              type=click.IntRange(min=1))
+@click.option("--precision", default="float64", show_default=True,
+              type=click.Choice(["float64", "float32", "fixed"]))
+@click.option("--scale", default=1000.0, show_default=True,
+              type=click.FloatRange(min=0, min_open=True))
+def solve(file, n_lines, precision, scale):
+    if precision == "float64":
+        tuns = load_instance(file)
+    else:
+        tuns = load_compact(file, precision, scale)
+    if n_lines > 1:
+        gc = GreedyCover(timeout_s=5)
+        cover = gc.solve(tuns, n_lines)
+        for i, ln in enumerate(cover, 1):
+            click.echo(f"L{i:<2}: Z=+{ln.Z:<3} total={ln.Z_total:>3}")
+        click.echo(f"time={gc.runtime_ms:7.1f} ms")
+        _report_precision(tuns)
+        _save_cover_solution(cover, gc.runtime_ms)
+        click.echo(colorama.Fore.YELLOW + "Файл записано.")
+        return
     pe = PartialEnum(timeout_s=5)
     a_pe, k_pe, z_pe = pe.solve(tuns)
     t_pe = pe.runtime_ms
@@ -102,6 +123,7 @@ def solve(file):
     t_ga = (time.perf_counter() - t0) * 1e3
     click.echo(f"PE : Z={z_pe:>3}  time={t_pe:7.1f} ms")
     click.echo(f"GA : Z={best.Z:>3}  time={t_ga:7.1f} ms")
+    _report_precision(tuns)
     _save_both_solutions({
         "PE": {"a": a_pe, "k": k_pe, "Z": z_pe, "T": t_pe},
         "GA": {"a": best.a, "k": best.k, "Z": best.Z, "T": t_ga}
@@ -109,6 +131,16 @@ def solve(file):
     click.echo(colorama.Fore.YELLOW + "Файл записано.")
 
 
+def _report_precision(tuns):
+    if not isinstance(tuns, CompactTunnels):
+        return
+    click.echo(f"float64: {tuns.nbytes_float64 / 1024:.1f} KiB → "
+               f"{tuns.precision}: {tuns.nbytes / 1024:.1f} KiB (з копією float64), "
+               f"економія {tuns.memory_saved() / 1024:.1f} KiB")
+    click.echo(f"перевірено у float64 {tuns.recheck_rate:.2%} "
+               f"({tuns.rechecks}/{tuns.tests})")
+
+
 @cli.command()
 @click.option("--n", required=True, type=int)
 @click.option("--seed", default=1, type=int)
@@ -127,7 +159,27 @@ def generate(n, seed):
 @click.option("--k-auto/--k-manual", default=True)
 @click.option("--k-list", default="")
 @click.option("--N", "n_tasks", default=20, show_default=True, type=int)
-def experiments(n_min, n_max, step, m_list, k_auto, k_list, n_tasks):
+@click.option("--resume", "run_dir", default=None,
+              type=click.Path(exists=True, file_okay=False),
+              help="Продовжити серію; конфігурація береться з manifest.json.")
+@click.pass_context
+def experiments(ctx, n_min, n_max, step, m_list, k_auto, k_list, n_tasks, run_dir):
+    if run_dir:
+        given = [p.opts[0] for p in ctx.command.params
+                 if p.name != "run_dir"
+                 and ctx.get_parameter_source(p.name)
+                 is not click.core.ParameterSource.DEFAULT]
+        if given:
+            raise click.UsageError(
+                f"--resume не поєднується з {', '.join(given)}: "
+                "конфігурація береться з manifest.json.")
+        if not (Path(run_dir) / "manifest.json").exists():
+            raise click.BadParameter(f"у {run_dir} немає manifest.json",
+                                     param_hint="--resume")
+        csv_n, csv_m, csv_k = resume_experiment(run_dir)
+        click.echo(colorama.Fore.CYAN + "CSV-файли результатів:")
+        click.echo(f"  {csv_n}\n  {csv_m}\n  {csv_k}")
+        return
     n_range = range(n_min, n_max + 1, step)
     m_vals = [int(x) for x in m_list.split(",")]
     if k_auto:
@@ -184,7 +236,7 @@ def menu():
 
 
 def _exp_menu(cfg: Dict, N_def: int):
-    act = input("1.Налаштувати  2.Запустити : ").strip()
+    act = input("1.Налаштувати  2.Запустити  3.Продовжити : ").strip()
     if act == "1":
         n_min = int(input("n_min = "))
         n_max = int(input("n_max = "))
@@ -197,6 +249,13 @@ def _exp_menu(cfg: Dict, N_def: int):
             cfg["k_list"] = [int(x) for x in input("k_list = ").split(",")]
         cfg["_N"] = int(input("N (кількість задач) = ") or N_def)
         print("Конфігурацію збережено.")
+    elif act == "3":
+        run_dir = input("Каталог серії (results/experiments/run_…): ").strip()
+        if not (Path(run_dir) / "manifest.json").exists():
+            print(colorama.Fore.RED + f"У «{run_dir}» немає manifest.json.")
+            return
+        csv_n, csv_m, csv_k = resume_experiment(run_dir)
+        print(colorama.Fore.CYAN + "CSV:", csv_n, csv_m, csv_k, sep="\n  ")
     else:
         N = cfg.get("_N", N_def)
         csv_n, csv_m, csv_k = run_dim_experiment(cfg, repeats=N)
@@ -233,5 +292,16 @@ def _save_both_solutions(sol) -> Path:
     return path
 
 
+def _save_cover_solution(cover, runtime_ms: float) -> Path:
+    out = Path("results/individual")
+    out.mkdir(parents=True, exist_ok=True)
+    path = out / f"cover_{int(time.time())}.csv"
+    with path.open("w", newline="", encoding="utf-8") as f:
+        f.write("line;a;k;Z;Z_total;runtime_ms\n")
+        for i, ln in enumerate(cover, 1):
+            f.write(f"{i};{ln.a};{ln.k};{ln.Z};{ln.Z_total};{runtime_ms:.1f}\n")
+    return path
+
+
 if __name__ == "__main__":
     cli()
\ No newline at end of file
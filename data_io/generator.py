@@ -1,11 +1,12 @@
 from __future__ import annotations
 import random
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
+from geometry.compact import CompactTunnels
 from geometry.primitives import Point, Rectangle
 
-__all__ = ["random_instance"]
+__all__ = ["random_instance", "random_compact"]
 
-def random_instance(
+def _random_rows(
     n: int,
     x0: float,
     y0: float,
@@ -14,26 +15,54 @@ def random_instance(
     w_range: Tuple[float, float],
     h_range: Tuple[float, float],
     seed: int | None = None,
-) -> List[Rectangle]:
-    """
-    Генерує n прямокутних тунелів рівномірно у прямокутнику
-    [x0; x0+dx] × [y0; y0+dy] із випадковими шириною та висотою.
-    """
+) -> Iterator[Tuple[int, List[float]]]:
     rnd = random.Random(seed)
-    rects: List[Rectangle] = []
-
     for rid in range(1, n + 1):
         cx = rnd.uniform(x0, x0 + dx)
         cy = rnd.uniform(y0, y0 + dy)
         w = rnd.uniform(*w_range)
         h = rnd.uniform(*h_range)
-
-        corners = [
-            Point(cx - w / 2, cy - h / 2),
-            Point(cx + w / 2, cy - h / 2),
-            Point(cx + w / 2, cy + h / 2),
-            Point(cx - w / 2, cy + h / 2),
+        yield rid, [
+            cx - w / 2, cy - h / 2,
+            cx + w / 2, cy - h / 2,
+            cx + w / 2, cy + h / 2,
+            cx - w / 2, cy + h / 2,
         ]
+
+
+def random_instance(
+    n: int,
+    x0: float,
+    y0: float,
+    dx: float,
+    dy: float,
+    w_range: Tuple[float, float],
+    h_range: Tuple[float, float],
+    seed: int | None = None,
+) -> List[Rectangle]:
+    """
+    Генерує n прямокутних тунелів рівномірно у прямокутнику
+    [x0; x0+dx] × [y0; y0+dy] із випадковими шириною та висотою.
+    """
+    rects: List[Rectangle] = []
+    for rid, c in _random_rows(n, x0, y0, dx, dy, w_range, h_range, seed):
+        corners = [Point(c[i], c[i + 1]) for i in range(0, 8, 2)]
         rects.append(Rectangle(rid, corners))
+    return rects
+
 
-    return rects
\ No newline at end of file
+def random_compact(
+    n: int,
+    x0: float,
+    y0: float,
+    dx: float,
+    dy: float,
+    w_range: Tuple[float, float],
+    h_range: Tuple[float, float],
+    seed: int | None = None,
+    precision: str = "float32",
+    scale: float = 1000.0,
+) -> CompactTunnels:
+    """Те саме, що random_instance, але одразу в компактному сховищі."""
+    rows = _random_rows(n, x0, y0, dx, dy, w_range, h_range, seed)
+    return CompactTunnels(rows, precision, scale)
\ No newline at end of file
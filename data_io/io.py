@@ -1,37 +1,46 @@
 from __future__ import annotations
 import csv, json
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Tuple
+from geometry.compact import CompactTunnels
 from geometry.primitives import Point, Rectangle
 
-__all__ = ["load_instance", "save_instance", "save_solution"]
+__all__ = ["load_instance", "load_compact", "save_instance", "save_solution"]
 
 # читання
-def load_instance(path: str | Path) -> List[Rectangle]:
+def _read_rows(path: Path) -> Iterator[Tuple[int, List[float]]]:
     """
-    Читає задачу з CSV або JSON.
+    Рядки задачі як (id, [x1, y1, …, y4]).
     CSV: id;x1;y1;…;y4  (роздільник ;)
     JSON: {"tunnels":[{"id":1,"corners":[[x,y],…]},…]}
     """
-    path = Path(path)
     if path.suffix.lower() == ".json":
         data = json.loads(path.read_text(encoding="utf-8"))
-        rects = []
         for obj in data["tunnels"]:
-            pts = [Point(*xy) for xy in obj["corners"]]
-            rects.append(Rectangle(obj["id"], pts))
-        return rects
+            yield obj["id"], [float(v) for xy in obj["corners"] for v in xy]
+        return
 
-    # CSV
-    rects: List[Rectangle] = []
     with path.open(newline="", encoding="utf-8") as f:
         rdr = csv.reader(f, delimiter=";")
         for row in rdr:
             rid, *coords = map(float, row)
-            pts = [Point(coords[i], coords[i + 1]) for i in range(0, 8, 2)]
-            rects.append(Rectangle(int(rid), pts))
+            yield int(rid), coords
+
+
+def load_instance(path: str | Path) -> List[Rectangle]:
+    """Читає задачу з CSV або JSON."""
+    rects: List[Rectangle] = []
+    for rid, coords in _read_rows(Path(path)):
+        pts = [Point(coords[i], coords[i + 1]) for i in range(0, 8, 2)]
+        rects.append(Rectangle(rid, pts))
     return rects
 
+
+def load_compact(path: str | Path, precision: str = "float32",
+                 scale: float = 1000.0) -> CompactTunnels:
+    """Читає задачу одразу в компактне сховище, без об'єктів Point."""
+    return CompactTunnels(_read_rows(Path(path)), precision, scale)
+
 # запис задачі
 def save_instance(rects: List[Rectangle], path: str | Path) -> None:
     path = Path(path)
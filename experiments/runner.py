@@ -1,4 +1,6 @@
 from __future__ import annotations
+import json
+import os
 import time
 from math import log2
 from pathlib import Path
@@ -20,141 +22,251 @@ def _gen_tunnels(n: int, seed: int = 0):
     return random_instance(n, 0, 0, 20, 20, (1, 3), (1, 3), seed=seed)
 
 
+def _run_reps(
+    n: int,
+    seeds: Dict[str, List[int]],
+    ga_params: Dict,
+    pe_timeout: float,
+) -> Tuple[List[float], List[float], List[float], List[float]]:
+    """Повтори з зерен manifest-у: seeds["instance"] — задачі, seeds["ga"] — GA."""
+    z_pe, t_pe, z_ga, t_ga = [], [], [], []
+    for s_inst, s_ga in zip(seeds["instance"], seeds["ga"]):
+        tuns = _gen_tunnels(n, seed=s_inst)
+
+        pe = PartialEnum(timeout_s=pe_timeout)
+        _, _, z = pe.solve(tuns)
+        z_pe.append(z)
+        t_pe.append(pe.runtime_ms)
+
+        P = GAParams(**{**ga_params, "seed": s_ga})
+        t0 = time.perf_counter()
+        best = GeneticAlgorithm(tuns, P).run()
+        t_ga.append((time.perf_counter() - t0) * 1e3)
+        z_ga.append(best.Z)
+    return z_pe, t_pe, z_ga, t_ga
+
+
+def _raw(*series: List[float]) -> List[str]:
+    """Значення всіх повторів через кому — по колонці на серію."""
+    return [",".join(map(str, v)) for v in series]
+
+
+_RAW_COLS = ["R_pe_reps", "T_pe_reps", "R_ga_reps", "T_ga_reps"]
+
+
 def _exp_k_sweep(
     k_list: Iterable[int],
     n_pop: int,
-    repeats: int,
+    seeds: Dict[str, List[int]],
     base_ga: Dict,
+    path: Path,
     pe_timeout: float = 0.2,
-) -> Tuple[List[List[float]], int]:
-    rows = [["k", "g", "R_pe", "T_pe", "R_ga", "T_ga"]]
-    best_row = None
+) -> Tuple[List[List], int]:
+    header = ["k", "g", "R_pe", "T_pe", "R_ga", "T_ga"] + _RAW_COLS
+    rows = _load_rows(path, header)
+    done = {r[0] for r in rows}
     for k in k_list:
+        if str(k) in done:
+            continue
         g_val = int(k * n_pop * log2(n_pop))
         print(f"[E-1] k = {k}  (g = {g_val}) …", flush=True)
-        z_ga, t_ga, z_pe, t_pe = [], [], [], []
-        for rep in range(repeats):
-            tuns = _gen_tunnels(n_pop, seed=rep)
-
-            pe = PartialEnum(timeout_s=pe_timeout)
-            _, _, z = pe.solve(tuns)
-            z_pe.append(z)
-            t_pe.append(pe.runtime_ms)
-
-            P = GAParams(**{**base_ga, "g": g_val, "G": g_val, "seed": rep})
-            t0 = time.perf_counter()
-            best = GeneticAlgorithm(tuns, P).run()
-            t_ga.append((time.perf_counter() - t0) * 1e3)
-            z_ga.append(best.Z)
-
-        row = [k, g_val, _avg(z_pe), _avg(t_pe), _avg(z_ga), _avg(t_ga)]
+        z_pe, t_pe, z_ga, t_ga = _run_reps(
+            n_pop, seeds, {**base_ga, "g": g_val, "G": g_val}, pe_timeout
+        )
+        row = [k, g_val, _avg(z_pe), _avg(t_pe), _avg(z_ga), _avg(t_ga),
+               *_raw(z_pe, t_pe, z_ga, t_ga)]
+        _append_row(path, header, row)
         rows.append(row)
-        if best_row is None or row[4] > best_row[4] or (
-            row[4] == best_row[4] and row[5] < best_row[5]
+
+    best_row = None
+    for row in rows:
+        if best_row is None or float(row[4]) > float(best_row[4]) or (
+            float(row[4]) == float(best_row[4])
+            and float(row[5]) < float(best_row[5])
         ):
             best_row = row
     k_best = int(best_row[0])
-    return rows, k_best
+    return [header] + rows, k_best
 
 
 def _exp_m_sweep(
     m_list: Iterable[int],
     n_pop: int,
     g_fix: int,
-    repeats: int,
+    seeds: Dict[str, List[int]],
     base_ga: Dict,
+    path: Path,
     pe_timeout: float = 0.2,
-) -> List[List[float]]:
-    rows = [["m", "R_pe", "T_pe", "R_ga", "T_ga"]]
+) -> List[List]:
+    header = ["m", "R_pe", "T_pe", "R_ga", "T_ga"] + _RAW_COLS
+    rows = _load_rows(path, header)
+    done = {r[0] for r in rows}
     for m in m_list:
+        if str(m) in done:
+            continue
         print(f"[E-2] m = {m} …", flush=True)
-        z_ga, t_ga, z_pe, t_pe = [], [], [], []
-        for rep in range(repeats):
-            tuns = _gen_tunnels(n_pop, seed=rep)
-
-            pe = PartialEnum(timeout_s=pe_timeout)
-            _, _, z = pe.solve(tuns)
-            z_pe.append(z)
-            t_pe.append(pe.runtime_ms)
-
-            P = GAParams(
-                **{**base_ga, "m": m, "g": g_fix, "G": g_fix, "seed": rep}
-            )
-            t0 = time.perf_counter()
-            best = GeneticAlgorithm(tuns, P).run()
-            t_ga.append((time.perf_counter() - t0) * 1e3)
-            z_ga.append(best.Z)
-
-        rows.append([m, _avg(z_pe), _avg(t_pe), _avg(z_ga), _avg(t_ga)])
-    return rows
+        z_pe, t_pe, z_ga, t_ga = _run_reps(
+            n_pop, seeds, {**base_ga, "m": m, "g": g_fix, "G": g_fix},
+            pe_timeout
+        )
+        row = [m, _avg(z_pe), _avg(t_pe), _avg(z_ga), _avg(t_ga),
+               *_raw(z_pe, t_pe, z_ga, t_ga)]
+        _append_row(path, header, row)
+        rows.append(row)
+    return [header] + rows
 
 
 def _exp_n_sweep(
     n_range: Iterable[int],
     k_best: int,
-    repeats: int,
+    seeds: Dict[str, List[int]],
     base_ga: Dict,
+    path: Path,
     pe_timeout: float = 0.2,
-) -> List[List[float]]:
-    rows = [["n", "R_pe", "T_pe", "R_ga", "T_ga", "ΔF"]]
+) -> List[List]:
+    header = ["n", "R_pe", "T_pe", "R_ga", "T_ga", "ΔF"] + _RAW_COLS
+    rows = _load_rows(path, header)
+    done = {r[0] for r in rows}
     for n in n_range:
+        if str(n) in done:
+            continue
         g_n = int(k_best * n * log2(n))
         print(f"[E-3] n = {n}  (g = {g_n}) …", flush=True)
-        z_ga, t_ga, z_pe, t_pe = [], [], [], []
-        for rep in range(repeats):
-            tuns = _gen_tunnels(n, seed=rep)
-
-            pe = PartialEnum(timeout_s=pe_timeout)
-            _, _, z = pe.solve(tuns)
-            z_pe.append(z)
-            t_pe.append(pe.runtime_ms)
-
-            P = GAParams(
-                **{**base_ga, "g": g_n, "G": g_n, "seed": rep}
-            )
-            t0 = time.perf_counter()
-            best = GeneticAlgorithm(tuns, P).run()
-            t_ga.append((time.perf_counter() - t0) * 1e3)
-            z_ga.append(best.Z)
-
+        z_pe, t_pe, z_ga, t_ga = _run_reps(
+            n, seeds, {**base_ga, "g": g_n, "G": g_n}, pe_timeout
+        )
         ΔF = _avg(z_ga) - _avg(z_pe)
-        rows.append([n, _avg(z_pe), _avg(t_pe), _avg(z_ga), _avg(t_ga), ΔF])
-    return rows
+        row = [n, _avg(z_pe), _avg(t_pe), _avg(z_ga), _avg(t_ga), ΔF,
+               *_raw(z_pe, t_pe, z_ga, t_ga)]
+        _append_row(path, header, row)
+        rows.append(row)
+    return [header] + rows
 
 
-def run_dim_experiment(cfg: Dict, repeats: int) -> Tuple[Path, Path, Path]:
-    base_ga0 = dict(m=50, p=0.2, k_off=0.3, d_a=0.5, d_k=1.0)
-    out = Path("results/experiments")
-    out.mkdir(parents=True, exist_ok=True)
-    ts = str(int(time.time()))
+_BASE_GA = dict(m=50, p=0.2, k_off=0.3, d_a=0.5, d_k=1.0)
+_PE_TIMEOUT = 0.2
+
 
-    n_pop = cfg.get("n_pop", 50)
-    k_rows, k_best = _exp_k_sweep(cfg["k_list"], n_pop, repeats, base_ga0)
-    csv_k = out / f"exp_stop_k_{ts}.csv"
-    _save_csv(k_rows, csv_k)
+def run_dim_experiment(cfg: Dict, repeats: int,
+                       run_dir: Path | None = None) -> Tuple[Path, Path, Path]:
+    """
+    Нова серія експериментів у каталозі run_dir
+    (за замовчуванням results/experiments/run_<timestamp>).
+    """
+    ts = str(int(time.time()))
+    run_dir = Path(run_dir or Path("results/experiments") / f"run_{ts}")
+    run_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "created": int(ts),
+        "repeats": repeats,
+        "cfg": {
+            "n_range": list(cfg["n_range"]),
+            "m_list": list(cfg["m_list"]),
+            "k_list": list(cfg["k_list"]),
+            "n_pop": cfg.get("n_pop", 50),
+        },
+        "base_ga": _BASE_GA,
+        "pe_timeout": _PE_TIMEOUT,
+        "seeds": {"instance": list(range(repeats)), "ga": list(range(repeats))},
+        "status": "running",
+    }
+    _save_manifest(run_dir, manifest)
+    return _run_sweeps(run_dir, manifest)
+
+
+def resume_experiment(run_dir: str | Path) -> Tuple[Path, Path, Path]:
+    """Продовжує серію з останньої завершеної клітинки, конфігурація — з manifest.json."""
+    path = Path(run_dir) / "manifest.json"
+    if not path.exists():
+        raise FileNotFoundError(f"{run_dir}: немає manifest.json — це не каталог серії")
+    run_dir = path.parent
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    return _run_sweeps(run_dir, manifest)
+
+
+def _run_sweeps(run_dir: Path, manifest: Dict) -> Tuple[Path, Path, Path]:
+    print(f"[run] {run_dir}", flush=True)
+    cfg = manifest["cfg"]
+    seeds = manifest["seeds"]
+    base_ga0 = manifest["base_ga"]
+    pe_timeout = manifest["pe_timeout"]
+    n_pop = cfg["n_pop"]
+
+    csv_k = run_dir / "exp_stop_k.csv"
+    k_rows, k_best = _exp_k_sweep(cfg["k_list"], n_pop, seeds, base_ga0,
+                                  csv_k, pe_timeout)
 
     g_fix = int(k_best * n_pop * log2(n_pop))
     base_ga = {**base_ga0, "m": 50}
 
-    m_rows = _exp_m_sweep(cfg["m_list"], n_pop, g_fix, repeats, base_ga)
-    csv_m = out / f"exp_population_{ts}.csv"
-    _save_csv(m_rows, csv_m)
+    csv_m = run_dir / "exp_population.csv"
+    _exp_m_sweep(cfg["m_list"], n_pop, g_fix, seeds, base_ga, csv_m, pe_timeout)
 
-    n_rows = _exp_n_sweep(cfg["n_range"], k_best, repeats, base_ga)
-    csv_n = out / f"exp_dimension_{ts}.csv"
-    _save_csv(n_rows, csv_n)
+    csv_n = run_dir / "exp_dimension.csv"
+    _exp_n_sweep(cfg["n_range"], k_best, seeds, base_ga, csv_n, pe_timeout)
 
-    figs = out / "figures"
+    figs = run_dir / "figures"
     figs.mkdir(exist_ok=True)
-    _plot(csv_n, "n", "T_ga", "T-vs-n", figs / f"T_vs_n_{ts}.png")
-    _plot(csv_n, "n", "R_ga", "R-vs-n", figs / f"R_vs_n_{ts}.png")
-    _plot(csv_n, "n", "ΔF", "DeltaF-vs-n", figs / f"Delta_vs_n_{ts}.png")
+    _plot(csv_n, "n", "T_ga", "T-vs-n", figs / "T_vs_n.png")
+    _plot(csv_n, "n", "R_ga", "R-vs-n", figs / "R_vs_n.png")
+    _plot(csv_n, "n", "ΔF", "DeltaF-vs-n", figs / "Delta_vs_n.png")
 
+    _save_manifest(run_dir, {**manifest, "k_best": k_best, "status": "done"})
     return csv_n, csv_m, csv_k
 
 
+def _save_manifest(run_dir: Path, manifest: Dict):
+    _write_atomic(run_dir / "manifest.json",
+                  json.dumps(manifest, ensure_ascii=False, indent=2))
+
+
+def _write_atomic(path: Path, text: str):
+    """Через тимчасовий файл і os.replace: на диску або старий вміст, або новий."""
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _load_rows(path: Path, header: List[str]) -> List[List[str]]:
+    """
+    Уже завершені рядки sweep-а. Обірваний хвіст відрізається
+    до останнього повного рядка; файл переписується лише тоді,
+    коли в ньому є рядки з неправильною кількістю колонок.
+    """
+    if not path.exists():
+        return []
+    data = path.read_bytes()
+    if not data.endswith(b"\n"):
+        end = data.rfind(b"\n") + 1
+        os.truncate(path, end)
+        data = data[:end]
+    lines = data.decode("utf-8").splitlines()
+    if not lines:
+        return []
+    if lines[0].split(";") != header:
+        raise ValueError(f"{path}: неочікуваний заголовок {lines[0]!r}")
+    rows = [ln.split(";") for ln in lines[1:]]
+    good = [r for r in rows if len(r) == len(header)]
+    if len(good) != len(rows):
+        _save_csv([header] + good, path)
+    return good
+
+
+def _append_row(path: Path, header: List[str], row: List):
+    new = not path.exists() or path.stat().st_size == 0
+    with path.open("a", encoding="utf-8") as f:
+        if new:
+            f.write(";".join(header) + "\n")
+        f.write(";".join(map(str, row)) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
 def _save_csv(rows: List[List], path: Path):
-    path.write_text("\n".join(";".join(map(str, r)) for r in rows), encoding="utf-8")
+    _write_atomic(path, "".join(";".join(map(str, r)) + "\n" for r in rows))
 
 
 def _plot(csv_path: Path, x: str, y: str, title: str, out_png: Path):
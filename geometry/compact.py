@@ -0,0 +1,148 @@
+"""
+ Компактне зберігання тунелів зі зниженою точністю координат.
+ Гаряче ядро перетину читає float32 або цілі з фіксованою комою;
+ тунелі, для яких рішення «перетинає/ні» лежить у межах похибки
+ округлення, перевіряються повторно у float64, тож Z збігається
+ з повноточним результатом.
+
+ Економія — у резидентній пам'яті відносно List[Rectangle] з Point.
+ Ядро написане на чистому Python: кожне читання з масиву однаково
+ створює float, тож виграшу в пропускній здатності пам'яті немає.
+"""
+from __future__ import annotations
+import sys
+from array import array
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from geometry.primitives import Point, Rectangle
+
+__all__ = ["CompactTunnels", "PRECISIONS"]
+
+PRECISIONS = ("float32", "fixed")
+
+# відносна похибка float32 та запас на округлення обчислень у float64
+_F32_REL = 2.0 ** -24
+_F64_SLACK = 2.0 ** -48
+_I32_MAX = 2 ** 31 - 1
+
+
+class CompactTunnels:
+    """
+    _hot — координати для ядра перетину (float32 або int32),
+    _cold — ті самі координати у float64: з них будуються прямі-кандидати
+    та робиться повторна перевірка сумнівних тунелів.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[int, Sequence[float]]],
+                 precision: str = "float32", scale: float = 1000.0):
+        if precision not in PRECISIONS:
+            raise ValueError(f"precision має бути одним із {PRECISIONS}")
+        if scale <= 0:
+            raise ValueError("scale має бути додатним")
+        self.precision = precision
+        self.scale = scale
+        self._ids = array("q")
+        self._cold = array("d")
+        for rid, coords in rows:
+            if len(coords) != 8:
+                raise ValueError(f"тунель {rid}: очікується 8 координат, "
+                                 f"отримано {len(coords)}")
+            self._ids.append(int(rid))
+            self._cold.extend(coords)
+
+        self._top = max(map(abs, self._cold), default=0.0)
+        if precision == "float32":
+            self._hot = array("f", self._cold)
+            self._inv = 1.0
+            self._err = self._top * _F32_REL
+        else:
+            if self._top * scale > _I32_MAX:
+                raise ValueError("координати не вміщуються в int32 при такому scale")
+            self._hot = array("i", (round(v * scale) for v in self._cold))
+            self._inv = 1.0 / scale
+            self._err = 0.5 / scale
+        self.tests = 0
+        self.rechecks = 0
+
+    @classmethod
+    def from_rectangles(cls, rects: List[Rectangle],
+                        precision: str = "float32",
+                        scale: float = 1000.0) -> CompactTunnels:
+        rows = ((r.id, [v for p in r.corners for v in (p.x, p.y)]) for r in rects)
+        return cls(rows, precision, scale)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, i: int) -> Rectangle:
+        """Тунель у повній точності (float64)."""
+        c, b = self._cold, 8 * i
+        return Rectangle(self._ids[i],
+                         [Point(c[b + j], c[b + j + 1]) for j in range(0, 8, 2)])
+
+    def __iter__(self) -> Iterator[Rectangle]:
+        return (self[i] for i in range(len(self)))
+
+    def corner_pairs(self) -> Iterator[Tuple[float, float, float, float]]:
+        """Пари вершин різних тунелів у float64, у тому ж порядку, що й для списку."""
+        c, n = self._cold, len(self)
+        for i in range(n):
+            for j in range(i + 1, n):
+                for p in range(8 * i, 8 * i + 8, 2):
+                    x1, y1 = c[p], c[p + 1]
+                    for q in range(8 * j, 8 * j + 8, 2):
+                        yield x1, y1, c[q], c[q + 1]
+
+    def _scan(self, a: float, k: float) -> List[int]:
+        h, c = self._hot, self._cold
+        abs_a = abs(a)
+        eps = (self._err * (1.0 + abs_a)
+               + _F64_SLACK * (self._top * (1.0 + abs_a) + abs(k)))
+        # рахуємо в одиницях _hot, щоб не множити кожну координату на 1/scale
+        ks, eps = k / self._inv, eps / self._inv
+        hits: List[int] = []
+        rechecks = 0
+        for i in range(len(self)):
+            b = 8 * i
+            s0 = h[b + 1] - a * h[b] - ks
+            s1 = h[b + 3] - a * h[b + 2] - ks
+            s2 = h[b + 5] - a * h[b + 4] - ks
+            s3 = h[b + 7] - a * h[b + 6] - ks
+            lo, hi = min(s0, s1, s2, s3), max(s0, s1, s2, s3)
+            if lo + eps <= 0 <= hi - eps:
+                hits.append(i)
+            elif lo - eps <= 0 <= hi + eps:
+                # та сама арифметика, що й у line_intersects
+                rechecks += 1
+                s = [c[b + j + 1] - a * c[b + j] - k for j in range(0, 8, 2)]
+                if min(s) <= 0 <= max(s):
+                    hits.append(i)
+        self.tests += len(self)
+        self.rechecks += rechecks
+        return hits
+
+    def count_hits(self, a: float, k: float) -> int:
+        return len(self._scan(a, k))
+
+    def hit_indices(self, a: float, k: float) -> List[int]:
+        return self._scan(a, k)
+
+    @property
+    def recheck_rate(self) -> float:
+        return self.rechecks / self.tests if self.tests else 0.0
+
+    @property
+    def nbytes(self) -> int:
+        """Усе, що сховище тримає в пам'яті, включно з копією float64."""
+        return sum(x.itemsize * len(x) for x in (self._ids, self._hot, self._cold))
+
+    @property
+    def nbytes_float64(self) -> int:
+        """Скільки займає та сама задача як List[Rectangle] (--precision float64)."""
+        per_corner = sys.getsizeof(Point(0.0, 0.0)) + 2 * sys.getsizeof(0.0)
+        per_rect = (sys.getsizeof(Rectangle(0, [])) + sys.getsizeof([None] * 4)
+                    + sys.getsizeof(0) + 8 + 4 * per_corner)
+        return sys.getsizeof([]) + len(self) * per_rect
+
+    def memory_saved(self) -> int:
+        return self.nbytes_float64 - self.nbytes
@@ -0,0 +1,45 @@
+import pytest
+
+from algorithms.partial_enum import solve
+from data_io.generator import random_compact, random_instance
+from geometry.compact import CompactTunnels
+from geometry.primitives import Point, Rectangle
+
+
+def test_compact_same_Z():
+    """Знижена точність не змінює результат PE."""
+    args = dict(n=15, x0=0, y0=0, dx=10, dy=10,
+                w_range=(1, 2), h_range=(1, 2), seed=3)
+    ref = solve(random_instance(**args))
+    for precision in ("float32", "fixed"):
+        ct = random_compact(**args, precision=precision)
+        assert solve(ct) == ref
+        assert ct.rechecks > 0
+        assert 0 < ct.memory_saved() < ct.nbytes_float64
+
+
+def test_compact_recheck_on_boundary():
+    """Пряма майже через вершину перевіряється у float64."""
+    r = Rectangle(1, [Point(0.1, 0.1), Point(2.1, 0.1),
+                      Point(2.1, 1.1), Point(0.1, 1.1)])
+    ct = CompactTunnels.from_rectangles([r], "float32")
+    assert ct.count_hits(a=0, k=1.1) == 1
+    assert ct.count_hits(a=0, k=1.1 + 1e-12) == 0
+    assert ct.rechecks == 2
+    assert ct.count_hits(a=0, k=0.5) == 1
+    assert ct.rechecks == 2
+
+
+@pytest.mark.parametrize("scale", [0, -1000])
+def test_compact_rejects_bad_scale(scale):
+    """Нульовий або від'ємний scale ламає оцінку похибки."""
+    r = Rectangle(1, [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)])
+    with pytest.raises(ValueError):
+        CompactTunnels.from_rectangles([r], "fixed", scale=scale)
+
+
+def test_compact_rejects_bad_row_width():
+    """Рядок з іншою кількістю координат не зсуває наступні тунелі."""
+    rows = [(1, [0.0] * 9), (2, [5.0, 5.0, 6.0, 5.0, 6.0, 6.0, 5.0, 6.0])]
+    with pytest.raises(ValueError):
+        CompactTunnels(rows)
@@ -0,0 +1,24 @@
+from algorithms.greedy_cover import solve
+from algorithms.partial_enum import solve as pe_solve
+from data_io.generator import random_instance
+from geometry.primitives import line_intersects
+
+
+def test_greedy_cover_rounds():
+    """Перша пряма збігається з PE, покриття накопичується без повторів."""
+    tunnels = random_instance(
+        n=12, x0=0, y0=0, dx=10, dy=10,
+        w_range=(1, 2), h_range=(1, 2),
+        seed=7
+    )
+    cover = solve(tunnels, L=3)
+    a, k, Z = pe_solve(tunnels)
+    assert (cover[0].a, cover[0].k, cover[0].Z) == (a, k, Z)
+
+    covered = set()
+    for ln in cover:
+        new = {r.id for r in tunnels if line_intersects(r, ln.a, ln.k)} - covered
+        assert ln.Z == len(new) > 0
+        covered |= new
+        assert ln.Z_total == len(covered)
+    assert [ln.Z for ln in cover] == sorted((ln.Z for ln in cover), reverse=True)
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("matplotlib")
+
+from experiments import runner
+
+
+def test_resume_recomputes_only_missing_cell(tmp_path, monkeypatch):
+    """Обірваний останній рядок рахується заново, решта береться з CSV."""
+    monkeypatch.setattr(runner, "_plot", lambda *a, **kw: None)
+    monkeypatch.setattr(runner, "_PE_TIMEOUT", 0.01)
+    cfg = {"n_range": range(4, 6), "m_list": [4], "k_list": [1, 2], "n_pop": 4}
+    run_dir = tmp_path / "run"
+    runner.run_dim_experiment(cfg, repeats=1, run_dir=run_dir)
+    manifest = json.loads((run_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["status"] == "done"
+
+    csv_n = run_dir / "exp_dimension.csv"
+    full = csv_n.read_text(encoding="utf-8")
+    csv_n.write_text(full[:full.rindex("\n", 0, -1) + 6], encoding="utf-8")
+
+    calls = []
+    run_reps = runner._run_reps
+
+    def spy(n, seeds, ga_params, pe_timeout):
+        calls.append(n)
+        return run_reps(n, seeds, ga_params, pe_timeout)
+
+    monkeypatch.setattr(runner, "_run_reps", spy)
+    runner.resume_experiment(run_dir)
+
+    assert calls == [5]
+    resumed = json.loads((run_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert resumed["k_best"] == manifest["k_best"]
+    assert resumed["seeds"] == manifest["seeds"]
+    lines = csv_n.read_text(encoding="utf-8").splitlines()
+    assert [ln.split(";")[0] for ln in lines[1:]] == ["4", "5"]
+
+
+def test_load_rows_drops_bad_rows(tmp_path):
+    """Рядки з неправильною кількістю колонок відкидаються, цілі лишаються."""
+    path = tmp_path / "exp.csv"
+    path.write_text("m;R\n10;1.0\n20\n30;2.0\n40;3", encoding="utf-8")
+    assert runner._load_rows(path, ["m", "R"]) == [["10", "1.0"], ["30", "2.0"]]
+    assert path.read_text(encoding="utf-8") == "m;R\n10;1.0\n30;2.0\n"
+
+
+def test_resume_without_manifest(tmp_path):
+    """Каталог без manifest.json дає зрозумілу помилку."""
+    with pytest.raises(FileNotFoundError, match="manifest.json"):
+        runner.resume_experiment(tmp_path)